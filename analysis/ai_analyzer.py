@@ -36,16 +36,21 @@ class AIAnalyzer:
             # Rate limit check
             self._rate_limit()
             # Calculate basic metrics
-            latest_price = price_data['close'].iloc[-1] if not price_data.empty else None
-            first_price = price_data['close'].iloc[0] if not price_data.empty else None
+            has_data = len(price_data) > 0
+            if has_data:
+                close_values = price_data['close'].to_numpy()
+                latest_price = close_values[-1]
+                first_price = close_values[0]
+            else:
+                latest_price = first_price = None
             price_change = ((latest_price - first_price) / first_price * 100) if all(x is not None for x in [latest_price, first_price]) else 0
-            high = price_data['high'].max() if not price_data.empty else None
-            low = price_data['low'].min() if not price_data.empty else None
-            volume = price_data['volume'].sum() if 'volume' in price_data.columns and not price_data.empty else None
+            high = price_data['high'].max() if has_data else None
+            low = price_data['low'].min() if has_data else None
+            volume = price_data['volume'].sum() if 'volume' in price_data.columns and has_data else None
 
             # Calculate technical indicators for context
             rolling_window = min(20, len(price_data))
-            sma = price_data['close'].rolling(window=rolling_window).mean().iloc[-1] if not price_data.empty else None
+            sma = price_data['close'].rolling(window=rolling_window).mean().iloc[-1] if has_data else None
             rsi = 50  # Placeholder - implement actual RSI calculation if needed
 
             # Prepare data summary for AI analysis
@@ -136,7 +141,7 @@ class AIAnalyzer:
     def analyze_patterns(self, price_data: pd.DataFrame) -> List[Dict[str, Any]]:
         """Identify and analyze price patterns using AI"""
         try:
-            if price_data.empty:
+            if len(price_data) == 0:
                 return []
 
             price_data['returns'] = price_data['close'].pct_change()
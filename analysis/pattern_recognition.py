@@ -13,7 +13,22 @@ class PatternResult:
     support_level: Optional[float] = None
     resistance_level: Optional[float] = None
 
-def detect_head_and_shoulders(prices: pd.Series, window: int = 20) -> Optional[PatternResult]:
+def _peak_indices(values: np.ndarray) -> np.ndarray:
+    """
+    Indices of local maxima (strictly above both neighbours)
+    """
+    mid = values[1:-1]
+    return np.flatnonzero((values[:-2] < mid) & (mid > values[2:])) + 1
+
+def _turning_point_indices(values: np.ndarray) -> np.ndarray:
+    """
+    Indices of local maxima and minima, in order
+    """
+    mid = values[1:-1]
+    prev, nxt = values[:-2], values[2:]
+    return np.flatnonzero(((prev < mid) & (mid > nxt)) | ((prev > mid) & (mid < nxt))) + 1
+
+def detect_head_and_shoulders(prices: np.ndarray, window: int = 20) -> Optional[PatternResult]:
     """
     Detect head and shoulders pattern in price data
     Returns None if no pattern is found
@@ -23,10 +38,8 @@ def detect_head_and_shoulders(prices: pd.Series, window: int = 20) -> Optional[P
             return None
 
         # Find local maxima
-        peaks = []
-        for i in range(1, len(prices)-1):
-            if prices[i-1] < prices[i] > prices[i+1]:
-                peaks.append((i, prices[i]))
+        peak_idx = _peak_indices(prices)
+        peaks = list(zip(peak_idx, prices[peak_idx]))
 
         if len(peaks) < 3:
             return None
@@ -57,7 +70,7 @@ def detect_head_and_shoulders(prices: pd.Series, window: int = 20) -> Optional[P
         return None
     return None
 
-def detect_triangle_pattern(prices: pd.Series, window: int = 20) -> Optional[PatternResult]:
+def detect_triangle_pattern(prices: np.ndarray, window: int = 20) -> Optional[PatternResult]:
     """
     Detect ascending, descending, or symmetrical triangle patterns
     """
@@ -139,7 +152,7 @@ def calculate_bollinger_bands(prices: pd.Series, window: int = 20, num_std: floa
     except Exception:
         return None
 
-def detect_divergence(prices: pd.Series, rsi: pd.Series, window: int = 20) -> Optional[PatternResult]:
+def detect_divergence(prices: np.ndarray, rsi: np.ndarray, window: int = 20) -> Optional[PatternResult]:
     """
     Detect RSI divergence patterns
     """
@@ -148,19 +161,10 @@ def detect_divergence(prices: pd.Series, rsi: pd.Series, window: int = 20) -> Op
             return None
 
         # Find price and RSI peaks/troughs
-        price_peaks = []
-        rsi_peaks = []
-
-        for i in range(1, len(prices)-1):
-            if prices[i-1] < prices[i] > prices[i+1]:
-                price_peaks.append((i, prices[i], 'peak'))
-            elif prices[i-1] > prices[i] < prices[i+1]:
-                price_peaks.append((i, prices[i], 'trough'))
-
-            if rsi[i-1] < rsi[i] > rsi[i+1]:
-                rsi_peaks.append((i, rsi[i], 'peak'))
-            elif rsi[i-1] > rsi[i] < rsi[i+1]:
-                rsi_peaks.append((i, rsi[i], 'trough'))
+        price_idx = _turning_point_indices(prices)
+        rsi_idx = _turning_point_indices(rsi)
+        price_peaks = list(zip(price_idx, prices[price_idx]))
+        rsi_peaks = list(zip(rsi_idx, rsi[rsi_idx]))
 
         # Look for divergence
         if len(price_peaks) >= 2 and len(rsi_peaks) >= 2:
@@ -205,16 +209,20 @@ def analyze_patterns(price_data: pd.DataFrame) -> Dict[str, Union[List[Dict], Di
 
         patterns = []
 
+        # Convert once; the detectors index positionally and never need the pandas index
+        close_values = close_prices.to_numpy(dtype=np.float64)
+        rsi_values = rsi.to_numpy(dtype=np.float64)
+
         # Detect various patterns
-        hs_pattern = detect_head_and_shoulders(close_prices)
+        hs_pattern = detect_head_and_shoulders(close_values)
         if hs_pattern:
             patterns.append(hs_pattern)
 
-        triangle = detect_triangle_pattern(close_prices)
+        triangle = detect_triangle_pattern(close_values)
         if triangle:
             patterns.append(triangle)
 
-        divergence = detect_divergence(close_prices, rsi)
+        divergence = detect_divergence(close_values, rsi_values)
         if divergence:
             patterns.append(divergence)
 
@@ -239,7 +247,7 @@ def analyze_patterns(price_data: pd.DataFrame) -> Dict[str, Union[List[Dict], Di
             'patterns': formatted_patterns,
             'bollinger_bands': bb,
             'pattern_count': len(patterns),
-            'rsi': rsi.iloc[-1] if not rsi.empty else None
+            'rsi': rsi_values[-1] if len(rsi_values) > 0 else None
         }
 
     except Exception as e:
@@ -59,13 +59,13 @@ def analyze_price_trends(price_data: pd.DataFrame, timeframe: str = '24h') -> Di
         macd = exp1 - exp2
         signal = macd.ewm(span=9, adjust=False).mean()
 
-        # Current values
-        current_price = close_prices.iloc[-1]
-        current_sma_20 = sma_20.iloc[-1]
-        current_sma_50 = sma_50.iloc[-1]
-        current_rsi = rsi.iloc[-1]
-        current_macd = macd.iloc[-1]
-        current_signal = signal.iloc[-1]
+        # Current values (positional reads on the arrays skip the pandas indexer)
+        current_price = close_prices.to_numpy()[-1]
+        current_sma_20 = sma_20.to_numpy()[-1]
+        current_sma_50 = sma_50.to_numpy()[-1]
+        current_rsi = rsi.to_numpy()[-1]
+        current_macd = macd.to_numpy()[-1]
+        current_signal = signal.to_numpy()[-1]
 
         # Get pattern analysis
         pattern_analysis = analyze_patterns(price_data)
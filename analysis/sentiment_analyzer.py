@@ -1,19 +1,39 @@
+from functools import lru_cache
 from typing import Dict, List
 import nltk
+import numpy as np
 from nltk.sentiment import SentimentIntensityAnalyzer
-from statistics import mean
 
-# Download required NLTK data
-nltk.download('vader_lexicon')
+# Download required NLTK data, skipping the index check when it's already installed
+try:
+    nltk.data.find('sentiment/vader_lexicon.zip')
+except LookupError:
+    nltk.download('vader_lexicon')
+
+# Labels indexed by bucket code
+SENTIMENT_LABELS = ('negative', 'neutral', 'positive')
+
+def _bucket_scores(scores: np.ndarray) -> np.ndarray:
+    """
+    Map compound scores to bucket codes (0 = negative, 1 = neutral, 2 = positive)
+    """
+    return (scores >= -0.05).astype(np.intp) + (scores > 0.05)
+
+@lru_cache(maxsize=None)
+def _get_analyzer() -> SentimentIntensityAnalyzer:
+    """
+    Build the VADER analyzer once per process; parsing its lexicon is the slow part
+    """
+    return SentimentIntensityAnalyzer()
 
 def analyze_sentiment(news_items: List[Dict]) -> Dict:
     """
     Analyze sentiment of news articles using NLTK's VADER
     """
-    sia = SentimentIntensityAnalyzer()
+    sia = _get_analyzer()
     
-    sentiments = []
-    for item in news_items:
+    sentiments = np.empty(len(news_items))
+    for i, item in enumerate(news_items):
         # Analyze both title and content
         title_sentiment = sia.polarity_scores(item['title'])
         content_sentiment = sia.polarity_scores(item['content']) if item['content'] else {'compound': 0}
@@ -22,20 +42,23 @@ def analyze_sentiment(news_items: List[Dict]) -> Dict:
         combined_sentiment = (title_sentiment['compound'] * 0.4 + 
                             content_sentiment['compound'] * 0.6)
         
-        sentiments.append(combined_sentiment)
-        
-        # Add sentiment to news item
-        item['sentiment'] = 'positive' if combined_sentiment > 0.05 else 'negative' if combined_sentiment < -0.05 else 'neutral'
+        sentiments[i] = combined_sentiment
+
+    # Bucket all scores in one pass and label each news item from it
+    buckets = _bucket_scores(sentiments)
+    for item, bucket in zip(news_items, buckets):
+        item['sentiment'] = SENTIMENT_LABELS[bucket]
 
     # Calculate overall sentiment
-    avg_sentiment = mean(sentiments)
+    avg_sentiment = float(sentiments.mean())
+    counts = np.bincount(buckets, minlength=3)
     
     return {
         'overall': 'positive' if avg_sentiment > 0.05 else 'negative' if avg_sentiment < -0.05 else 'neutral',
         'score': round(avg_sentiment, 2),
         'distribution': {
-            'positive': len([s for s in sentiments if s > 0.05]),
-            'neutral': len([s for s in sentiments if -0.05 <= s <= 0.05]),
-            'negative': len([s for s in sentiments if s < -0.05])
+            'positive': int(counts[2]),
+            'neutral': int(counts[1]),
+            'negative': int(counts[0])
         }
     }
@@ -0,0 +1,27 @@
+import logging
+import os
+from functools import lru_cache
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+COINGECKO_BASE_URL = "https://api.coingecko.com/api/v3"
+
+# Read once per process; every collector and the page share it
+COINGECKO_API_KEY = os.environ.get('COINGECKO_API_KEY', '').strip()
+
+@lru_cache(maxsize=None)
+def get_coingecko_client() -> httpx.Client:
+    """
+    Shared HTTP/2 client so CoinGecko requests multiplex over one pooled connection.
+    The API key rides along as a default header, so callers don't rebuild it per request.
+    """
+    logger.info("Creating shared HTTP/2 client for CoinGecko")
+    transport = httpx.HTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=8),
+        retries=3  # Retry failed connection attempts
+    )
+    headers = {'x-cg-api-key': COINGECKO_API_KEY} if COINGECKO_API_KEY else None
+    return httpx.Client(transport=transport, timeout=10, headers=headers)
@@ -1,8 +1,8 @@
-import requests
+import httpx
 from typing import List, Dict
 from datetime import datetime, timedelta
-import os
 import logging
+from data_collectors.http_client import COINGECKO_API_KEY, COINGECKO_BASE_URL, get_coingecko_client
 
 logger = logging.getLogger(__name__)
 
@@ -12,9 +12,7 @@ def get_crypto_news(symbol: str) -> List[Dict]:
     """
     news_items = []
 
-    # Get API key from environment
-    api_key = os.environ.get('COINGECKO_API_KEY', '').strip()
-    if not api_key:
+    if not COINGECKO_API_KEY:
         logger.error("CoinGecko API key not found in environment variables")
         return []
 
@@ -38,14 +36,12 @@ def get_crypto_news(symbol: str) -> List[Dict]:
         return []
 
     # CoinGecko API endpoint for news
-    url = f"https://api.coingecko.com/api/v3/coins/{coin_id}/news"
+    url = f"{COINGECKO_BASE_URL}/coins/{coin_id}/news"
 
-    headers = {
-        'x-cg-api-key': api_key  # Changed to lowercase as per CoinGecko's requirements
-    }
+    client = get_coingecko_client()
 
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = client.get(url)
 
         if response.status_code == 429:
             logger.error("CoinGecko API rate limit reached")
@@ -55,8 +51,8 @@ def get_crypto_news(symbol: str) -> List[Dict]:
             return []
         elif response.status_code == 404:
             # Fallback to general news endpoint if coin-specific news not found
-            url = "https://api.coingecko.com/api/v3/news"
-            response = requests.get(url, headers=headers, timeout=10)
+            url = f"{COINGECKO_BASE_URL}/news"
+            response = client.get(url)
 
         response.raise_for_status()
         data = response.json()
@@ -74,7 +70,7 @@ def get_crypto_news(symbol: str) -> List[Dict]:
 
         return news_items
 
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Error fetching news from CoinGecko: {str(e)}")
         return []
     except Exception as e:
@@ -1,16 +1,16 @@
-import requests
+import httpx
 import pandas as pd
 from datetime import datetime, timedelta
 import logging
 import time
-import os
 import numpy as np
 from typing import Optional
+from data_collectors.http_client import COINGECKO_API_KEY, COINGECKO_BASE_URL, get_coingecko_client
 
 logger = logging.getLogger(__name__)
 
 class CoinGeckoClient:
-    BASE_URL = "https://api.coingecko.com/api/v3"
+    BASE_URL = COINGECKO_BASE_URL
 
     @staticmethod
     def get_coin_id(crypto: str) -> str:
@@ -29,12 +29,12 @@ class CoinGeckoClient:
         """Fetch market chart data from CoinGecko with retry logic"""
         max_retries = 3
         retry_delay = 2  # Increased from 1 to 2 seconds
-        api_key = os.environ.get('COINGECKO_API_KEY', '').strip()
 
-        if not api_key:
+        if not COINGECKO_API_KEY:
             logger.error("CoinGecko API key not found")
             return None
 
+        client = get_coingecko_client()
         for attempt in range(max_retries):
             try:
                 url = f"{cls.BASE_URL}/coins/{coin_id}/market_chart"
@@ -44,16 +44,7 @@ class CoinGeckoClient:
                     "interval": "hourly" if days == "1" else "daily"
                 }
 
-                headers = {
-                    'X-CG-API-Key': api_key  # Fixed header name to match CoinGecko's requirements
-                }
-
-                response = requests.get(
-                    url, 
-                    params=params, 
-                    headers=headers,
-                    timeout=10
-                )
+                response = client.get(url, params=params)
 
                 if response.status_code == 429:
                     logger.warning(f"Rate limit exceeded (attempt {attempt + 1}/{max_retries})")
@@ -69,7 +60,7 @@ class CoinGeckoClient:
                 response.raise_for_status()
                 return response.json()
 
-            except requests.exceptions.RequestException as e:
+            except httpx.HTTPError as e:
                 logger.warning(f"Attempt {attempt + 1}/{max_retries} failed: {str(e)}")
                 if attempt < max_retries - 1:
                     time.sleep(retry_delay * (attempt + 1))
@@ -4,6 +4,10 @@ import pandas as pd
 import os
 from datetime import datetime, timedelta
 
+# Credentials are read once per process instead of on every call
+REDDIT_CLIENT_ID = os.environ.get('REDDIT_CLIENT_ID')
+REDDIT_CLIENT_SECRET = os.environ.get('REDDIT_CLIENT_SECRET')
+
 def get_social_data(symbol: str) -> Dict:
     """
     Collect social media data from Reddit (Free API) and Twitter (mocked)
@@ -20,8 +24,8 @@ def get_reddit_data(symbol: str) -> pd.DataFrame:
     """
     Collect data from Reddit using their API (Free tier)
     """
-    client_id = os.environ.get('REDDIT_CLIENT_ID')
-    client_secret = os.environ.get('REDDIT_CLIENT_SECRET')
+    client_id = REDDIT_CLIENT_ID
+    client_secret = REDDIT_CLIENT_SECRET
 
     if not client_id or not client_secret:
         print("Reddit API credentials not found")
@@ -1,19 +1,23 @@
-import os
 import logging
 from datetime import datetime
 from typing import List, Dict, Optional
-import requests
+import httpx
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from models import TrendingCoin
 from database import db
+from data_collectors.http_client import COINGECKO_API_KEY, COINGECKO_BASE_URL, get_coingecko_client
 
 logger = logging.getLogger(__name__)
 
+# Built once so SQLAlchemy can reuse the compiled INSERT from its query cache
+_TRENDING_INSERT = insert(TrendingCoin)
+
 class TrendingCollector:
     """Collects trending coin data from CoinGecko"""
 
     def __init__(self):
-        self.api_key = os.environ.get('COINGECKO_API_KEY', '').strip()
+        self.api_key = COINGECKO_API_KEY
         if not self.api_key:
             logger.error("CoinGecko API key not found")
             raise ValueError("CoinGecko API key is required")
@@ -21,12 +25,8 @@ class TrendingCollector:
     def fetch_trending_coins(self) -> Optional[List[Dict]]:
         """Fetch trending coins from CoinGecko API"""
         try:
-            url = "https://api.coingecko.com/api/v3/search/trending"
-            headers = {
-                'x-cg-api-key': self.api_key  # Changed to lowercase
-            }
-
-            response = requests.get(url, headers=headers, timeout=10)
+            url = f"{COINGECKO_BASE_URL}/search/trending"
+            response = get_coingecko_client().get(url)
 
             if response.status_code == 429:
                 logger.error("CoinGecko API rate limit reached")
@@ -45,7 +45,7 @@ class TrendingCollector:
 
             return data.get('coins', [])
 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Error fetching trending coins: {str(e)}")
             return None
 
@@ -55,28 +55,30 @@ class TrendingCollector:
             with db.get_session() as session:
                 timestamp = datetime.utcnow()
 
-                for coin in trending_data:
+                rows = []
+                for rank, coin in enumerate(trending_data):
                     coin_item = coin.get('item', {})
                     if not coin_item.get('id') or not coin_item.get('symbol'):
                         continue
 
-                    trending_coin = TrendingCoin(
-                        coin_id=coin_item.get('id'),
-                        symbol=coin_item.get('symbol', '').upper(),
-                        name=coin_item.get('name'),
-                        market_cap_rank=coin_item.get('market_cap_rank'),
-                        price_btc=coin_item.get('price_btc'),
-                        score=len(trending_data) - trending_data.index(coin),  # Higher score for higher ranking
-                        coin_metadata={
+                    rows.append({
+                        'coin_id': coin_item.get('id'),
+                        'symbol': coin_item.get('symbol', '').upper(),
+                        'name': coin_item.get('name'),
+                        'market_cap_rank': coin_item.get('market_cap_rank'),
+                        'price_btc': coin_item.get('price_btc'),
+                        'score': len(trending_data) - rank,  # Higher score for higher ranking
+                        'coin_metadata': {
                             'thumb': coin_item.get('thumb'),
                             'small': coin_item.get('small'),
                             'large': coin_item.get('large'),
                             'slug': coin_item.get('slug')
                         },
-                        timestamp=timestamp
-                    )
-                    session.add(trending_coin)
+                        'timestamp': timestamp
+                    })
 
+                if rows:
+                    session.execute(_TRENDING_INSERT, rows)
                 session.commit()
                 return True
 
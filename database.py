@@ -30,7 +30,8 @@ class Database:
             pool_size=5,
             max_overflow=10,
             pool_timeout=30,
-            pool_recycle=1800
+            pool_recycle=1800,
+            query_cache_size=1200
         )
         
         self.session_factory = sessionmaker(bind=self.engine)
@@ -1,21 +1,12 @@
 import streamlit as st
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import pandas as pd
-import os
 import time
-import json
 import logging
-import requests 
-from data_collectors.price_collector import get_crypto_prices
-from data_collectors.news_collector import get_crypto_news
-from data_collectors.social_collector import get_social_data
-from data_collectors.trending_collector import TrendingCollector
-from analysis.price_analyzer import analyze_price_trends
-from analysis.sentiment_analyzer import analyze_sentiment
-from utils.email_sender import send_daily_report
-from utils.data_storage import store_analysis_results
-from database import db  # Add the missing import
+import copy
+from concurrent.futures import ThreadPoolExecutor
+import httpx
+from data_collectors.http_client import COINGECKO_API_KEY, COINGECKO_BASE_URL, get_coingecko_client
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -35,9 +26,57 @@ AVAILABLE_COINS = {
     "LINK": {"name": "Chainlink", "id": "chainlink"}
 }
 
-def apply_tradingview_style():
-    """Apply TradingView-inspired dark theme"""
-    st.markdown("""
+# Sidebar selector labels, built once at import
+COIN_OPTIONS = {f"{symbol} - {info['name']}": symbol
+                for symbol, info in AVAILABLE_COINS.items()}
+COIN_OPTION_LABELS = list(COIN_OPTIONS)
+
+# News sentiment icons; anything else renders as neutral
+SENTIMENT_EMOJI = {
+    'positive': "🟢",
+    'negative': "🔴"
+}
+
+# TradingView palette for up/down moves
+UP_COLOR = "#26a69a"
+DOWN_COLOR = "#ef5350"
+
+# Clock format for the trending coins' "Updated" line
+UPDATED_TIME_FORMAT = '%I:%M %p UTC'
+
+# Trade signal colors; HOLD and anything unexpected render grey
+SIGNAL_COLORS = {
+    'BUY': UP_COLOR,
+    'SELL': DOWN_COLOR
+}
+
+# HTML skeletons for the per-rerun widgets; only the values are formatted in
+PRICE_CARD_TEMPLATE = """
+<div class="tradingview-widget-container">
+    <div style="display: flex; flex-direction: column; gap: 0.5rem;">
+        <h3 style="color: #d1d4dc; margin: 0;">{name} ({coin})</h3>
+        <div class="price-display" style="{color}">
+            ${price:,.2f}
+        </div>
+        <div style="{color}">
+            {change:+.2f}% (24h)
+        </div>
+    </div>
+</div>
+"""
+
+PRICE_LEVEL_TEMPLATE = """
+<div style="color: {color}; margin: 0.5rem 0;">
+    {label}: ${level:,.2f}
+</div>
+"""
+
+def _trend_color(is_up):
+    """Green for an up/positive reading, red otherwise"""
+    return UP_COLOR if is_up else DOWN_COLOR
+
+# TradingView-inspired dark theme, emitted on every run since Streamlit drops elements a rerun skips
+TRADINGVIEW_CSS = """
         <style>
         /* Basic theme colors */
         .main {
@@ -118,67 +157,182 @@ def apply_tradingview_style():
             color: #d1d4dc;
         }
         </style>
-    """, unsafe_allow_html=True)
+"""
 
-def get_real_crypto_price(crypto):
-    """Get real-time price data from CoinGecko"""
+def apply_tradingview_style():
+    """Apply TradingView-inspired dark theme"""
+    st.markdown(TRADINGVIEW_CSS, unsafe_allow_html=True)
+
+# Every listed coin in one comma-joined /simple/price request
+ALL_COIN_IDS = ",".join(info['id'] for info in AVAILABLE_COINS.values())
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _all_real_crypto_prices():
+    """Live prices for all listed coins in one CoinGecko call, shared for 30s across sessions"""
     try:
-        api_key = os.environ.get('COINGECKO_API_KEY')
-        if not api_key:
+        if not COINGECKO_API_KEY:
             logger.error("CoinGecko API key not found")
             return None
 
-        coin_id = AVAILABLE_COINS.get(crypto, {}).get('id')
-        if not coin_id:
-            logger.error(f"Unknown coin symbol: {crypto}")
-            return None
-
-        url = "https://api.coingecko.com/api/v3/simple/price"
+        url = f"{COINGECKO_BASE_URL}/simple/price"
         params = {
-            'ids': coin_id,
+            'ids': ALL_COIN_IDS,
             'vs_currencies': 'usd',
             'include_24hr_change': 'true'
         }
 
-        headers = {
-            'X-Cg-Api-Key': api_key
-        }
-
-        response = requests.get(url, params=params, headers=headers, timeout=10)
+        response = get_coingecko_client().get(url, params=params)
 
         if response.status_code == 200:
-            data = response.json()
-            return {
-                'price': data[coin_id]['usd'],
-                'change_24h': data[coin_id].get('usd_24h_change', 0)
-            }
+            return response.json()
         else:
             logger.error(f"CoinGecko API error: {response.status_code}")
             return None
-    except Exception as e:
+    except (httpx.HTTPError, ValueError) as e:
         logger.error(f"Error fetching real-time price: {str(e)}")
         return None
 
+def get_real_crypto_price(crypto):
+    """Get real-time price data for one coin from the batched CoinGecko lookup"""
+    coin_id = AVAILABLE_COINS.get(crypto, {}).get('id')
+    if not coin_id:
+        logger.error(f"Unknown coin symbol: {crypto}")
+        return None
+
+    # A partial payload can lack the coin or its usd quote
+    coin_data = (_all_real_crypto_prices() or {}).get(coin_id, {})
+    price = coin_data.get('usd')
+    if price is None:
+        return None
+
+    return {
+        'price': price,
+        'change_24h': coin_data.get('usd_24h_change', 0)
+    }
+
+# Bounded so the coin x timeframe key space can't grow the cache without limit
+@st.cache_data(ttl=60, max_entries=25, show_spinner=False)
+def _cached_intraday_prices(crypto, timeframe):
+    """Cached hourly price history for the 24h view"""
+    from data_collectors.price_collector import get_crypto_prices
+
+    return get_crypto_prices(crypto, timeframe)
+
+@st.cache_data(ttl=300, max_entries=25, show_spinner=False)
+def _cached_daily_prices(crypto, timeframe):
+    """Cached price history for the 7d/30d views"""
+    from data_collectors.price_collector import get_crypto_prices
+
+    return get_crypto_prices(crypto, timeframe)
+
+@st.cache_data(ttl=120, show_spinner=False)
+def cached_news_with_sentiment(crypto):
+    """Get news labelled with sentiment, cached so reruns skip CoinGecko and VADER"""
+    # Deferred: importing the analyzer loads NLTK and checks the VADER lexicon
+    from analysis.sentiment_analyzer import analyze_sentiment
+    from data_collectors.news_collector import get_crypto_news
+
+    news = get_crypto_news(crypto)
+    sentiment = analyze_sentiment(news) if news else None
+    return news, sentiment
+
+def _prices_fingerprint(prices):
+    """Cheap cache key for a price frame: row count, time span and last close"""
+    if len(prices) == 0:
+        return (0,)
+    timestamps = prices['timestamp']
+    return (len(prices), timestamps.iloc[0].value, timestamps.iloc[-1].value, float(prices['close'].iloc[-1]))
+
+@st.cache_data(ttl=300, show_spinner=False, hash_funcs={pd.DataFrame: _prices_fingerprint})
+def cached_price_trends(prices):
+    """Trend analysis memoized on the price data, so unchanged history isn't re-analyzed"""
+    # Deferred: the analyzer pulls in the OpenAI client and the pattern detectors
+    from analysis.price_analyzer import analyze_price_trends
+
+    return analyze_price_trends(prices)
+
+@st.cache_resource
+def _fetch_pool():
+    """Thread pool shared across sessions for the independent API fetches"""
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="fetch")
+
+@st.cache_resource
+def _report_pool():
+    """Background workers for report storage and email, off the render thread"""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="report")
+
+def _log_report_failure(future):
+    """Done-callback for background report jobs, so failures reach the log with a traceback"""
+    error = future.exception()
+    if error is not None:
+        logger.error(f"Background report task failed: {str(error)}", exc_info=error)
+
+def cached_crypto_prices(crypto, timeframe):
+    """Get price history through the Streamlit cache so reruns skip CoinGecko"""
+    if timeframe == "24h":
+        return _cached_intraday_prices(crypto, timeframe)
+    return _cached_daily_prices(crypto, timeframe)
+
+def _await(future, message, default=None):
+    """
+    Wait on a future, showing a spinner only if the result isn't ready yet.
+    A failed fetch is logged and replaced by default so one source can't blank the page.
+    """
+    try:
+        if future.done():
+            return future.result()
+        with st.spinner(message):
+            return future.result()
+    except Exception as e:
+        logger.error(f"Background fetch failed ({message}): {str(e)}")
+        return default
+
+def load_market_context(coin, timeframe):
+    """
+    Fetch and analyze everything the page renders for a coin and timeframe.
+    The result is kept for the rest of the minute, so reruns triggered by unrelated
+    widgets (chat input, buttons) skip the fetch pipeline. Only the current selection
+    is kept, since the context holds its price frame.
+    """
+    key = (coin, timeframe, int(time.time() // 60))
+    cached = st.session_state.get('market_context')
+    if cached and cached[0] == key:
+        return cached[1]
+
+    # Fire the independent API calls concurrently; wall time becomes the slowest call
+    pool = _fetch_pool()
+    price_future = pool.submit(get_real_crypto_price, coin)
+    history_future = pool.submit(cached_crypto_prices, coin, timeframe)
+    news_future = pool.submit(cached_news_with_sentiment, coin)
+
+    historical_prices = _await(history_future, 'Fetching price data...')
+    if historical_prices is not None and len(historical_prices) > 0:
+        trends = cached_price_trends(historical_prices)
+    else:
+        trends = None
+    news, sentiment = _await(news_future, 'Fetching latest news...', default=(None, None))
+
+    context = {
+        'price_data': _await(price_future, 'Fetching current price...'),
+        # The chart draws this same frame, so it always matches the trend analysis
+        'prices': historical_prices,
+        'trends': trends,
+        'news': news,
+        'sentiment': sentiment
+    }
+    st.session_state.market_context = (key, context)
+    return context
+
 def display_price_widget(price_data, coin):
     """Display current price in TradingView style with improved text wrapping"""
     if price_data:
         price = price_data['price']
         change = price_data['change_24h']
-        color = "color: #26a69a" if change > 0 else "color: #ef5350"
+        color = f"color: {_trend_color(change > 0)}"
 
-        st.markdown(f"""
-        <div class="tradingview-widget-container">
-            <div style="display: flex; flex-direction: column; gap: 0.5rem;">
-                <h3 style="color: #d1d4dc; margin: 0;">{AVAILABLE_COINS[coin]['name']} ({coin})</h3>
-                <div class="price-display" style="{color}">
-                    ${price:,.2f}
-                </div>
-                <div style="{color}">
-                    {change:+.2f}% (24h)
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(PRICE_CARD_TEMPLATE.format(
+            name=AVAILABLE_COINS[coin]['name'], coin=coin, color=color, price=price, change=change
+        ), unsafe_allow_html=True)
     else:
         st.error("Unable to fetch price data")
 
@@ -216,39 +370,32 @@ def display_trend_detection(price_analysis):
                 if 'support' in sr_levels:
                     support = sr_levels['support']
                     if isinstance(support, (int, float)):
-                        st.markdown(f"""
-                        <div style="color: #26a69a; margin: 0.5rem 0;">
-                            Support Level: ${support:,.2f}
-                        </div>
-                        """, unsafe_allow_html=True)
+                        st.markdown(PRICE_LEVEL_TEMPLATE.format(
+                            color=UP_COLOR, label="Support Level", level=support
+                        ), unsafe_allow_html=True)
                     elif isinstance(support, (list, tuple)) and support:
                         for i, level in enumerate(support[:2]):  # Show top 2 support levels
-                            st.markdown(f"""
-                            <div style="color: #26a69a; margin: 0.5rem 0;">
-                                Support Level #{i+1}: ${level:,.2f}
-                            </div>
-                            """, unsafe_allow_html=True)
+                            st.markdown(PRICE_LEVEL_TEMPLATE.format(
+                                color=UP_COLOR, label=f"Support Level #{i+1}", level=level
+                            ), unsafe_allow_html=True)
 
                 if 'resistance' in sr_levels:
                     resistance = sr_levels['resistance']
                     if isinstance(resistance, (int, float)):
-                        st.markdown(f"""
-                        <div style="color: #ef5350; margin: 0.5rem 0;">
-                            Resistance Level: ${resistance:,.2f}
-                        </div>
-                        """, unsafe_allow_html=True)
+                        st.markdown(PRICE_LEVEL_TEMPLATE.format(
+                            color=DOWN_COLOR, label="Resistance Level", level=resistance
+                        ), unsafe_allow_html=True)
                     elif isinstance(resistance, (list, tuple)) and resistance:
                         for i, level in enumerate(resistance[:2]):  # Show top 2 resistance levels
-                            st.markdown(f"""
-                            <div style="color: #ef5350; margin: 0.5rem 0;">
-                                Resistance Level #{i+1}: ${level:,.2f}
-                            </div>
-                            """, unsafe_allow_html=True)
+                            st.markdown(PRICE_LEVEL_TEMPLATE.format(
+                                color=DOWN_COLOR, label=f"Resistance Level #{i+1}", level=level
+                            ), unsafe_allow_html=True)
 
         st.markdown("</div>", unsafe_allow_html=True)
 
+@st.fragment
 def display_trending_coins():
-    """Display trending coins section"""
+    """Display trending coins section; a fragment, so Refresh doesn't rerun the page"""
     st.markdown("""
     <div class="tradingview-widget-container">
         <h3 style="color: #d1d4dc;">🔥 Trending Coins</h3>
@@ -256,6 +403,11 @@ def display_trending_coins():
     """, unsafe_allow_html=True)
 
     try:
+        # Deferred: importing database builds the engine and raises without DATABASE_URL;
+        # that should only cost this section, not the whole page
+        from data_collectors.trending_collector import TrendingCollector
+        from database import db
+
         # Initialize trending collector
         trending_collector = TrendingCollector()
 
@@ -282,7 +434,7 @@ def display_trending_coins():
                                 st.image(coin.coin_metadata['small'], width=50)
 
                         with col2:
-                            color = "#26a69a" if coin.score > 0.5 else "#ef5350"
+                            color = _trend_color(coin.score > 0.5)
                             st.markdown(f"""
                             <div style="color: #d1d4dc; padding: 0.5rem;">
                                 <div style="margin-bottom: 0.5rem;">
@@ -295,7 +447,7 @@ def display_trending_coins():
                                     <strong>Trending Score:</strong> {coin.score:.2f}
                                 </div>
                                 <div style="font-size: 0.8rem; color: #666;">
-                                    Updated: {coin.timestamp.strftime('%I:%M %p UTC')}
+                                    Updated: {coin.timestamp.strftime(UPDATED_TIME_FORMAT)}
                                 </div>
                             </div>
                             """, unsafe_allow_html=True)
@@ -306,16 +458,24 @@ def display_trending_coins():
         logger.error(f"Error in trending coins section: {str(e)}")
         st.error("Unable to load trending coins. Please try refreshing in a moment.")
 
+# Every new candle is a new key, so bound the figures like the price caches they come from
+@st.cache_data(ttl=300, max_entries=30, show_spinner=False, hash_funcs={pd.DataFrame: _prices_fingerprint})
 def create_candlestick_chart(prices, coin, timeframe):
     """Create an interactive candlestick chart"""
+    import plotly.graph_objects as go
+
     fig = go.Figure()
 
+    # Plain arrays take Plotly's NumPy encoding path instead of its pandas one.
+    # Epoch milliseconds serialize far smaller than ISO strings; the date axis renders them as times
+    epoch_ms = prices['timestamp'].to_numpy(dtype='datetime64[ms]').astype('int64')
+
     fig.add_trace(go.Candlestick(
-        x=prices['timestamp'],
-        open=prices['open'],
-        high=prices['high'],
-        low=prices['low'],
-        close=prices['close'],
+        x=epoch_ms,
+        open=prices['open'].to_numpy(),
+        high=prices['high'].to_numpy(),
+        low=prices['low'].to_numpy(),
+        close=prices['close'].to_numpy(),
         name="Price"
     ))
 
@@ -327,18 +487,17 @@ def create_candlestick_chart(prices, coin, timeframe):
         height=400,
         margin=dict(l=50, r=50, t=50, b=50),
         yaxis=dict(side="right"),
-        xaxis=dict(rangeslider=dict(visible=False))
+        xaxis=dict(type="date", rangeslider=dict(visible=False))
     )
 
     return fig
 
-def display_price_chart(coin, timeframe):
+def display_price_chart(prices, coin, timeframe):
     """Display interactive price chart"""
     try:
-        prices = get_crypto_prices(coin, timeframe)
-        if prices is not None and not prices.empty:
+        if prices is not None and len(prices) > 0:
             fig = create_candlestick_chart(prices, coin, timeframe)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, use_container_width=True, key=f"candles-{coin}-{timeframe}")
         else:
             st.error("Unable to load price data")
     except Exception as e:
@@ -347,88 +506,134 @@ def display_price_chart(coin, timeframe):
 
 def generate_daily_report(crypto, trends, news, sentiment):
     """Generates and handles report data"""
+    from utils.email_sender import send_daily_report
+    from utils.data_storage import store_analysis_results
+
     try:
         if not trends:
-            return False, "No price analysis data available. Please wait for data to load."
+            return False, "No price analysis data available. Please wait for data to load.", []
 
         report_data = {
             'timestamp': datetime.now(),
             'crypto': crypto,
+            # analyze_price_trends always returns the full key set (its fallback included),
+            # and every news item is labelled by analyze_sentiment, so index directly
             'price_analysis': {
-                'trend': trends.get('trend', 'unknown'),
-                'strength': trends.get('trend_strength', 'unknown'),
-                'analysis': trends.get('analysis', 'No analysis available'),
-                'indicators': trends.get('indicators', {})
+                'trend': trends['trend'],
+                'strength': trends['trend_strength'],
+                'analysis': trends['analysis'],
+                'indicators': trends['indicators']
             },
-            'news_sentiment': sentiment.get('overall', 'neutral'),
+            'news_sentiment': sentiment['overall'] if sentiment else 'neutral',
             'news_items': [
                 {
-                    'title': item.get('title', ''),
-                    'sentiment': item.get('sentiment', 'neutral'),
-                    'summary': item.get('summary', '')
+                    'title': item['title'],
+                    'sentiment': item['sentiment'],
+                    'summary': item['summary']
                 }
                 for item in (news[:5] if news else [])
             ]
         }
 
-        serialized_data = json.loads(json.dumps(report_data, default=json_serial))
-        store_analysis_results(serialized_data)
-        send_daily_report(serialized_data)
-        return True, "Daily report generated and sent successfully!"
+        # Disk write and SMTP send can take seconds; don't hold the button handler on them.
+        # Storage encodes with orjson, which handles the datetimes itself. The tasks run
+        # concurrently, so each gets its own copy of the report
+        pool = _report_pool()
+        jobs = []
+        for task in (store_analysis_results, send_daily_report):
+            job = pool.submit(task, copy.deepcopy(report_data))
+            job.add_done_callback(_log_report_failure)
+            jobs.append(job)
+        return True, "Daily report queued for storage and delivery.", jobs
 
     except Exception as e:
-        logger.error(f"Error in report generation: {str(e)}", exc_info=True)
-        return False, f"Error generating report: {str(e)}"
-
-def json_serial(obj):
-    if isinstance(obj, (datetime, pd.Timestamp)):
-        return obj.isoformat()
-    raise TypeError(f"Type {type(obj)} not serializable")
+        logger.error(f"Error in report generation: {str(e)}")
+        logger.debug("Report generation traceback", exc_info=True)
+        return False, f"Error generating report: {str(e)}", []
 
-def display_news_section(crypto):
+def display_news_section(crypto, news):
     """Display news with sentiment analysis"""
     try:
-        # Add loading state
-        with st.spinner('Fetching latest news...'):
-            news = get_crypto_news(crypto)
-
-            if news and isinstance(news, list) and len(news) > 0:
-                # Get sentiment analysis
-                sentiment = analyze_sentiment(news)
-
-                for item in news[:5]:  # Display top 5 news items
-                    if not isinstance(item, dict) or 'title' not in item:
-                        continue
-
-                    # Determine sentiment icon
-                    sentiment_color = (
-                        "🟢" if item.get('sentiment') == 'positive'
-                        else "🔴" if item.get('sentiment') == 'negative'
-                        else "⚪"
-                    )
-
-                    with st.expander(f"{sentiment_color} {item['title']}"):
-                        st.markdown(f"""
-                        <div style='color: #d1d4dc;'>
-                            {item.get('summary', 'No summary available')}
-                            <br><br>
-                            <small>Source: {item.get('source', 'Unknown')} • 
-                            Published: {item.get('published_at', 'N/A')}</small>
-                        </div>
-                        """, unsafe_allow_html=True)
-            else:
-                st.info("Unable to fetch news at the moment. Please try again later.")
-                logger.error(f"No news data returned for {crypto}")
+        if news and isinstance(news, list) and len(news) > 0:
+            # Display top 5 news items; filter and pick sentiment icons up front
+            top_news = [item for item in news[:5] if isinstance(item, dict) and 'title' in item]
+            icons = [SENTIMENT_EMOJI.get(item.get('sentiment'), "⚪") for item in top_news]
+
+            for item, sentiment_color in zip(top_news, icons):
+                with st.expander(f"{sentiment_color} {item['title']}"):
+                    st.markdown(f"""
+                    <div style='color: #d1d4dc;'>
+                        {item.get('summary', 'No summary available')}
+                        <br><br>
+                        <small>Source: {item.get('source', 'Unknown')} • 
+                        Published: {item.get('published_at', 'N/A')}</small>
+                    </div>
+                    """, unsafe_allow_html=True)
+        else:
+            st.info("Unable to fetch news at the moment. Please try again later.")
+            logger.error(f"No news data returned for {crypto}")
     except Exception as e:
         st.error("Unable to fetch news at the moment. Please try again later.")
         logger.error(f"Error in display_news_section: {str(e)}")
 
-def chat_interface():
-    """Display chat interface for user queries"""
+@st.fragment
+def report_panel(coin, context):
+    """Generate Report button; a fragment, so only a queued report reruns the whole page"""
+    # Outcome of the last queued report, handed over by report_status; shown once
+    outcome = st.session_state.pop('report_outcome', None)
+    if outcome:
+        success, message = outcome
+        if success:
+            st.success(message)
+        else:
+            st.error(message)
+
+    if st.button("Generate Report", key="single_report_btn"):
+        try:
+            with st.spinner("Generating comprehensive analysis..."):
+                # Reuse the news and sentiment already loaded for the page
+                success, message, jobs = generate_daily_report(
+                    coin,
+                    context['trends'],
+                    context['news'],
+                    context['sentiment']
+                )
+                if success:
+                    st.session_state.report_jobs = jobs
+                else:
+                    st.error(message)
+        except Exception as e:
+            st.error(f"Error generating report: {str(e)}")
+
+        # Full rerun so main() mounts report_status to poll the queued jobs
+        if 'report_jobs' in st.session_state:
+            st.rerun()
+
+@st.fragment(run_every="2s")
+def report_status():
+    """Poll the queued report jobs; once they finish, hand the outcome to report_panel"""
+    jobs = st.session_state.get('report_jobs')
+    if not jobs:
+        return
+    if not all(job.done() for job in jobs):
+        st.info("Daily report queued for storage and delivery.")
+        return
+
+    del st.session_state.report_jobs
+    errors = [job.exception() for job in jobs if job.exception() is not None]
+    if errors:
+        st.session_state.report_outcome = (False, f"Error generating report: {str(errors[0])}")
+    else:
+        st.session_state.report_outcome = (True, "Daily report generated and sent successfully!")
+    # Full rerun so report_panel shows the outcome and main() stops mounting this poller
+    st.rerun()
+
+@st.fragment
+def chat_interface(coin, context):
+    """Display chat interface for user queries; a fragment, so asking only reruns the chat"""
     st.subheader("💬 Chat Assistant")
 
-    if "chat_history" not in st.session_state:
-        st.session_state.chat_history = []
+    st.session_state.setdefault('chat_history', [])
 
     user_question = st.text_input(
         "Ask about market trends, technical analysis, or news impact:",
@@ -436,21 +641,22 @@ def chat_interface():
     )
 
     if user_question:
-        if st.session_state.current_coin and st.session_state.price_analysis:
-            response = f"Analysis for {st.session_state.current_coin}:\n\n"
+        trends = context['trends']
+        if coin and trends:
+            parts = [f"Analysis for {coin}:\n\n"]
 
             # Add price analysis
-            if 'trend' in st.session_state.price_analysis:
-                response += f"📈 Current Trend: {st.session_state.price_analysis['trend'].title()}\n"
-                response += f"💪 Trend Strength: {st.session_state.price_analysis['trend_strength'].title()}\n\n"
+            if 'trend' in trends:
+                parts.append(f"📈 Current Trend: {trends['trend'].title()}\n")
+                parts.append(f"💪 Trend Strength: {trends['trend_strength'].title()}\n\n")
 
             # Add technical indicators
-            if 'indicators' in st.session_state.price_analysis:
-                indicators = st.session_state.price_analysis['indicators']
-                response += "Technical Indicators:\n"
-                for indicator, value in indicators.items():
-                    response += f"• {indicator.upper()}: {value}\n"
+            if 'indicators' in trends:
+                indicators = trends['indicators']
+                parts.append("Technical Indicators:\n")
+                parts.extend(f"• {indicator.upper()}: {value}\n" for indicator, value in indicators.items())
 
+            response = "".join(parts)
             st.write(response)
             st.session_state.chat_history.append((user_question, response))
         else:
@@ -462,54 +668,46 @@ def main():
     apply_tradingview_style()
 
     # Check for required API keys
-    if not os.environ.get('COINGECKO_API_KEY'):
+    if not COINGECKO_API_KEY:
         st.error("CoinGecko API key is missing. Please add it to continue.")
         return
 
-    # Initialize session state
-    if 'current_coin' not in st.session_state:
-        st.session_state.current_coin = "BTC"
-    if 'price_analysis' not in st.session_state:
-        st.session_state.price_analysis = None
-
     # Sidebar controls
     with st.sidebar:
         st.title("📊 Controls")
-        coin_options = {f"{symbol} - {info['name']}": symbol
-                      for symbol, info in AVAILABLE_COINS.items()}
-        selected_display = st.selectbox(
-            "Select Cryptocurrency",
-            options=list(coin_options.keys()),
-            key='coin_selector'
-        )
-        selected_coin = coin_options[selected_display]
-        st.session_state.current_coin = selected_coin
-        timeframe = st.selectbox(
-            "Timeframe",
-            ["24h", "7d", "30d"],
-            key='timeframe_selector'
-        )
+        # A form buffers both selections so changing them costs one rerun, on Update
+        with st.form("controls"):
+            selected_display = st.selectbox(
+                "Select Cryptocurrency",
+                options=COIN_OPTION_LABELS,
+                key='coin_selector'
+            )
+            timeframe = st.selectbox(
+                "Timeframe",
+                ["24h", "7d", "30d"],
+                key='timeframe_selector'
+            )
+            st.form_submit_button("Update")
+        selected_coin = COIN_OPTIONS[selected_display]
 
     st.title("CryptoAI Platform")
 
     # Get price data and analysis
-    price_data = get_real_crypto_price(st.session_state.current_coin)
-    historical_prices = get_crypto_prices(st.session_state.current_coin, timeframe)
-
-    if historical_prices is not None and not historical_prices.empty:
-        st.session_state.price_analysis = analyze_price_trends(historical_prices)
-    else:
-        st.session_state.price_analysis = None
+    # Bind locally; every session_state attribute read goes through Streamlit's proxy
+    coin = selected_coin
+    context = load_market_context(coin, timeframe)
+    price_data = context['price_data']
+    price_analysis = context['trends']
 
     # Top section layout
     col1, col2, col3 = st.columns([2, 2, 3])
 
     with col1:
         st.markdown("### Price")
-        display_price_widget(price_data, st.session_state.current_coin)
+        display_price_widget(price_data, coin)
 
         # Move analysis here
-        if st.session_state.price_analysis:
+        if price_analysis:
             st.markdown("""
             <div style="height: 20px;"></div>
             """, unsafe_allow_html=True)
@@ -518,30 +716,30 @@ def main():
             <div class="indicator-panel">
                 <h4 style="color: #d1d4dc;">Price Analysis</h4>
                 <div style="color: #d1d4dc;">
-                    {st.session_state.price_analysis.get('analysis', 'Analysis not available')}
+                    {price_analysis.get('analysis', 'Analysis not available')}
                 </div>
             </div>
             """, unsafe_allow_html=True)
 
     with col2:
         st.markdown("### Market Overview")
-        if st.session_state.price_analysis:
-            signal = st.session_state.price_analysis.get('signal', 'HOLD')
-            signal_color = "#26a69a" if signal == "BUY" else "#ef5350" if signal == "SELL" else "#888888"
+        if price_analysis:
+            signal = price_analysis.get('signal', 'HOLD')
+            signal_color = SIGNAL_COLORS.get(signal, "#888888")
 
             st.markdown(f"""
             <div class="indicator-panel">
                 <h4 style="color: #d1d4dc;">Signal Strength</h4>
                 <div style="color: {signal_color}; font-size: 1.2rem;">{signal}</div>
                 <div style="color: #d1d4dc; font-size: 0.9rem;">
-                    Confidence: {st.session_state.price_analysis.get('confidence', 0)*100:.0f}%
+                    Confidence: {price_analysis.get('confidence', 0)*100:.0f}%
                 </div>
             </div>
             """, unsafe_allow_html=True)
 
     with col3:
         st.markdown("### Trend Detection")
-        display_trend_detection(st.session_state.price_analysis)
+        display_trend_detection(price_analysis)
 
     # Price Chart and Analysis Section
     st.markdown("---")
@@ -549,12 +747,12 @@ def main():
 
     with chart_col:
         st.markdown("### Price Chart")
-        display_price_chart(st.session_state.current_coin, timeframe)
+        display_price_chart(context['prices'], coin, timeframe)
 
         # Technical Indicators
-        if st.session_state.price_analysis and st.session_state.price_analysis.get('indicators'):
+        if price_analysis and price_analysis.get('indicators'):
             st.markdown("### Technical Indicators")
-            indicators = st.session_state.price_analysis['indicators']
+            indicators = price_analysis['indicators']
             for name, value in indicators.items():
                 if value is not None:
                     st.metric(
@@ -564,7 +762,7 @@ def main():
 
     with news_col:
         st.markdown("### Latest News")
-        display_news_section(st.session_state.current_coin)
+        display_news_section(coin, context['news'])
 
     # Add Trending Coins Section
     st.markdown("---")
@@ -576,19 +774,19 @@ def main():
 
     with intel_col1:
         st.markdown("### Market Intelligence")
-        if st.session_state.price_analysis:
-            sentiment = st.session_state.price_analysis.get('market_sentiment', 'Neutral')
+        if price_analysis:
+            sentiment = price_analysis.get('market_sentiment', 'Neutral')
             st.markdown(f"""
             <div class="indicator-panel">
                 <h4 style="color: #d1d4dc;">Market Overview</h4>
                 <div style="color: #d1d4dc;">
                     <p>Current Market Sentiment: {sentiment}</p>
-                    <p>24h Price Change: {st.session_state.price_analysis.get('price_change_percent', 0):.2f}%</p>
+                    <p>24h Price Change: {price_analysis.get('price_change_percent', 0):.2f}%</p>
                 </div>
             """, unsafe_allow_html=True)
 
-            if 'support_resistance' in st.session_state.price_analysis:
-                sr_levels = st.session_state.price_analysis['support_resistance']
+            if 'support_resistance' in price_analysis:
+                sr_levels = price_analysis['support_resistance']
                 if sr_levels.get('support'):
                     support = sr_levels['support']
                     # Handle both single value and list of values
@@ -610,25 +808,14 @@ def main():
             st.markdown("</div>", unsafe_allow_html=True)
 
     with intel_col2:
-        if st.button("Generate Report", key="single_report_btn"):
-            try:
-                with st.spinner("Generating comprehensive analysis..."):
-                    success, message = generate_daily_report(
-                        st.session_state.current_coin,
-                        st.session_state.price_analysis,
-                        get_crypto_news(st.session_state.current_coin),
-                        analyze_sentiment(get_crypto_news(st.session_state.current_coin))
-                    )
-                    if success:
-                        st.success(message)
-                    else:
-                        st.error(message)
-            except Exception as e:
-                st.error(f"Error generating report: {str(e)}")
+        report_panel(coin, context)
+        # Only poll while a queued report is still running
+        if 'report_jobs' in st.session_state:
+            report_status()
 
     # Chat Interface Section
     st.markdown("---")
-    chat_interface()
+    chat_interface(coin, context)
 
 
 if __name__ == "__main__":
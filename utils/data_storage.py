@@ -1,25 +1,51 @@
-import json
 from datetime import datetime
 from typing import Dict
+import orjson
 import pandas as pd
 
+def _json_default(obj):
+    """
+    orjson fallback for datetime subclasses such as pd.Timestamp, which it won't encode natively
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Type {type(obj)} not serializable")
+
 def store_analysis_results(analysis_data: Dict):
     """
     Store analysis results for historical reference
     """
     timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
     
-    # Convert DataFrame objects to lists for JSON serialization
-    if 'social_data' in analysis_data:
-        if isinstance(analysis_data['social_data']['reddit'], pd.DataFrame):
-            analysis_data['social_data']['reddit'] = analysis_data['social_data']['reddit'].to_dict('records')
-        if isinstance(analysis_data['social_data']['twitter'], pd.DataFrame):
-            analysis_data['social_data']['twitter'] = analysis_data['social_data']['twitter'].to_dict('records')
+    # Convert DataFrame objects to lists for JSON serialization; build new dicts
+    # so the caller's frames are left as they were
+    social_data = analysis_data.get('social_data')
+    if social_data:
+        social_data = dict(social_data)
+        for platform in ('reddit', 'twitter'):
+            platform_data = social_data.get(platform)
+            if isinstance(platform_data, pd.DataFrame):
+                # Build the rows from per-column lists rather than copying the frame via
+                # assign(); datetime columns are formatted in one vectorized pass, NaT becomes None
+                columns = {
+                    col: (
+                        values.dt.strftime('%Y-%m-%dT%H:%M:%S').where(values.notna(), None).tolist()
+                        if pd.api.types.is_datetime64_any_dtype(values)
+                        else values.tolist()
+                    )
+                    for col, values in platform_data.items()
+                }
+                social_data[platform] = [dict(zip(columns, row)) for row in zip(*columns.values())]
+        analysis_data = {**analysis_data, 'social_data': social_data}
 
     # Store as JSON file
     try:
-        with open(f'analysis_history_{timestamp}.json', 'w') as f:
-            json.dump(analysis_data, f, indent=4)
+        with open(f'analysis_history_{timestamp}.json', 'wb') as f:
+            f.write(orjson.dumps(
+                analysis_data,
+                default=_json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            ))
     except Exception as e:
         print(f"Error storing analysis results: {e}")
 
@@ -18,6 +18,10 @@ def send_daily_report(report_data: Dict):
     msg['From'] = sender_email
     msg['To'] = receiver_email
 
+    news_list = ''.join(
+        f"<li>{item['title']} ({item['sentiment']})</li>" for item in report_data['news_items']
+    )
+
     # Create HTML content
     html = f"""
     <html>
@@ -35,12 +39,12 @@ def send_daily_report(report_data: Dict):
             </ul>
 
             <h4>Sentiment Analysis</h4>
-            <p>Overall Sentiment: {report_data['sentiment']['overall']}</p>
-            <p>Sentiment Score: {report_data['sentiment']['score']}</p>
+            <p>Overall News Sentiment: {report_data['news_sentiment']}</p>
             
-            <h4>Social Media Insights</h4>
-            <p>Reddit Activity: {len(report_data['social_data']['reddit'])} posts</p>
-            <p>Twitter Activity: {len(report_data['social_data']['twitter'])} tweets</p>
+            <h4>Latest News</h4>
+            <ul>
+                {news_list}
+            </ul>
         </body>
     </html>
     """